@@ -1,21 +1,51 @@
 import os
+import contextlib
+import copy
+import stat
+import importlib.util
+import errno
 import json
-import shutil
 import logging
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Callable
 import time
+import uuid
 import argparse
+import queue
+import threading
+from collections import defaultdict
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, as_completed
 import sys
 try:
-    import tkinter as tk
-    from tkinter import filedialog, messagebox, ttk
-    TK_AVAILABLE = True
-except ImportError:  # pragma: no cover - depends on environment
-    tk = None
-    filedialog = messagebox = ttk = None
-    TK_AVAILABLE = False
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:  # pragma: no cover - not Windows
+    msvcrt = None
+# Tkinter is imported on first use so command-line runs don't load Tcl/Tk
+tk = filedialog = messagebox = ttk = None
+TK_AVAILABLE = importlib.util.find_spec("_tkinter") is not None
+
+
+def _import_tk() -> None:
+    """Import the Tkinter modules into the module namespace"""
+    global tk, filedialog, messagebox, ttk
+    if tk is None:
+        import tkinter as tk
+        from tkinter import filedialog, messagebox, ttk
 
 
 def init_logger() -> Path:
@@ -33,6 +63,7 @@ def init_logger() -> Path:
 
 # Configure logging
 init_logger()
+logger = logging.getLogger(__name__)
 
 
 def guess_save_directory() -> Optional[Path]:
@@ -58,50 +89,393 @@ def guess_save_directory() -> Optional[Path]:
             return location
     return None
 
-@dataclass
+
+# Index fields that describe a world file itself and are never copied over
+_INDEX_SKIP_FIELDS = frozenset(("id", "time", "deleted"))
+
+
+def _dumps_json(obj) -> bytes:
+    """Serialize to JSON, using orjson or msgspec when installed
+
+    Those backends indent in C at no real cost. The stdlib fallback writes
+    compact JSON, since its pretty-printer walks every element in Python
+    and the files are only read by the game and this tool.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    if msgspec is not None:
+        return msgspec.json.format(msgspec.json.encode(obj), indent=2)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads_json(data: bytes):
+    """Parse JSON bytes, using orjson or msgspec when installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+# Buffer size for the userspace copy fallback
+_COPY_BUFSIZE = 1 << 20
+
+# Bytes per copy_file_range/sendfile call; small enough that progress and
+# cancellation stay responsive on multi-gigabyte files
+_KERNEL_COPY_CHUNK = 1 << 26
+
+# Linux ioctl sharing a file's data blocks with another (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+# Errors meaning a kernel copy primitive is unusable for this pair of files
+_FAST_COPY_FALLBACK_ERRNOS = frozenset(
+    getattr(errno, name)
+    for name in ("EXDEV", "ENOSYS", "EINVAL", "EOPNOTSUPP", "ENOTSUP", "ETXTBSY", "EBADF")
+    if hasattr(errno, name)
+)
+
+# CopyFileExW progress routine results
+_PROGRESS_CONTINUE = 0
+_PROGRESS_CANCEL = 1
+
+if sys.platform == "win32":  # pragma: no cover - Windows only
+    import ctypes
+    from ctypes import wintypes
+
+    _PROGRESS_ROUTINE = ctypes.WINFUNCTYPE(
+        wintypes.DWORD,
+        wintypes.LARGE_INTEGER, wintypes.LARGE_INTEGER,
+        wintypes.LARGE_INTEGER, wintypes.LARGE_INTEGER,
+        wintypes.DWORD, wintypes.DWORD,
+        wintypes.HANDLE, wintypes.HANDLE, wintypes.LPVOID,
+    )
+    _CopyFileExW = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileExW
+    _CopyFileExW.argtypes = (
+        wintypes.LPCWSTR, wintypes.LPCWSTR, _PROGRESS_ROUTINE,
+        wintypes.LPVOID, wintypes.LPBOOL, wintypes.DWORD,
+    )
+    _CopyFileExW.restype = wintypes.BOOL
+else:
+    _CopyFileExW = None
+
+
+def _copy_file_ex(src: str | Path, dst: str | Path, report: Callable[[int], None]) -> bool:
+    """Copy with the Windows CopyFileExW API; return False if unavailable
+
+    The copy runs in the kernel and uses server-side copies on network
+    shares. Only the main data stream is reported, as the totals passed
+    to the progress routine also count alternate data streams such as
+    ``Zone.Identifier``. Exceptions from ``report`` cancel the copy and
+    are re-raised.
+    """
+    if _CopyFileExW is None:
+        return False
+    error: Optional[BaseException] = None
+
+    def on_progress(total, transferred, stream_size, stream_transferred, stream_number, *_):
+        nonlocal error
+        if stream_number != 1:
+            return _PROGRESS_CONTINUE
+        try:
+            report(stream_transferred)
+        except BaseException as e:
+            error = e
+            return _PROGRESS_CANCEL
+        return _PROGRESS_CONTINUE
+
+    if _CopyFileExW(os.fspath(src), os.fspath(dst), _PROGRESS_ROUTINE(on_progress), None, None, 0):
+        return True
+    if error is not None:
+        raise error
+    raise ctypes.WinError(ctypes.get_last_error())
+
+
+def _reflink(in_fd: int, out_fd: int, report: Callable[[int], None]) -> bool:
+    """Clone the file's data with the FICLONE ioctl; return False if unsupported
+
+    On copy-on-write filesystems (btrfs, XFS, bcachefs) the copy shares the
+    source's blocks and completes without reading or writing any data.
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(out_fd, _FICLONE, in_fd)
+    except OSError:
+        # Not a reflink-capable filesystem, or the files are on different ones
+        return False
+    report(os.fstat(out_fd).st_size)
+    return True
+
+
+def _copy_file_range(in_fd: int, out_fd: int, report: Callable[[int], None]) -> bool:
+    """Copy with os.copy_file_range; return False if unsupported"""
+    if not hasattr(os, "copy_file_range"):
+        return False
+    copied = 0
+    while True:
+        try:
+            n = os.copy_file_range(in_fd, out_fd, _KERNEL_COPY_CHUNK)
+        except OSError as e:
+            if copied == 0 and e.errno in _FAST_COPY_FALLBACK_ERRNOS:
+                return False
+            raise
+        if n == 0:
+            # Some filesystems report EOF straight away instead of failing
+            return copied > 0 or os.fstat(in_fd).st_size == 0
+        copied += n
+        report(copied)
+
+
+def _sendfile(in_fd: int, out_fd: int, report: Callable[[int], None]) -> bool:
+    """Copy with os.sendfile; return False if unsupported"""
+    # Only Linux accepts a regular file as the destination
+    if not sys.platform.startswith("linux"):
+        return False
+    copied = 0
+    while True:
+        try:
+            n = os.sendfile(out_fd, in_fd, None, _KERNEL_COPY_CHUNK)
+        except OSError as e:
+            if copied == 0 and e.errno in _FAST_COPY_FALLBACK_ERRNOS:
+                return False
+            raise
+        if n == 0:
+            return True
+        copied += n
+        report(copied)
+
+
+def _copy_fileobj(fsrc, fdst, report: Callable[[int], None]) -> None:
+    """Copy between raw file objects through a single reused 1 MiB buffer"""
+    buf = bytearray(_COPY_BUFSIZE)
+    copied = 0
+    with memoryview(buf) as mv:
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            # Raw writes may be short, so keep writing until the chunk is out
+            pos = 0
+            while pos < n:
+                pos += fdst.write(mv[pos:n])
+            copied += n
+            report(copied)
+
+
+def _fast_copy(
+    src: str | Path,
+    dst: str | Path,
+    progress: Optional[Callable[[int, int], None]] = None,
+    cancel: Optional[threading.Event] = None,
+) -> None:
+    """Copy a file and its timestamps, keeping the data in the kernel when possible
+
+    Uses ``CopyFileExW`` on Windows. Elsewhere tries a FICLONE reflink,
+    then ``copy_file_range``, then ``sendfile``, then a plain userspace
+    copy. The copy is flushed to disk before returning so it can
+    safely be renamed over an existing file.
+
+    ``progress`` is called with the bytes copied so far and the file size
+    after each chunk. Setting ``cancel`` aborts the copy with
+    ``CancelledError`` at the next chunk boundary.
+    """
+    st = os.stat(src)
+    total = st.st_size
+    copied_bytes = 0
+
+    def report(copied: int) -> None:
+        nonlocal copied_bytes
+        copied_bytes = copied
+        if progress:
+            progress(copied, total)
+        if cancel is not None and cancel.is_set():
+            raise CancelledError(f"Copy of {src} cancelled")
+
+    if _copy_file_ex(src, dst, report):
+        # CopyFileExW also copies the read-only attribute, which would stop
+        # the fsync below; the other paths always create a writable file
+        mode = os.stat(dst).st_mode
+        if not mode & stat.S_IWRITE:
+            os.chmod(dst, mode | stat.S_IWRITE)
+        with open(dst, 'rb+', buffering=0) as fdst:
+            os.fsync(fdst.fileno())
+    else:
+        with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+            in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+            if not (
+                _reflink(in_fd, out_fd, report)
+                or _copy_file_range(in_fd, out_fd, report)
+                or _sendfile(in_fd, out_fd, report)
+            ):
+                _copy_fileobj(fsrc, fdst, report)
+            os.fsync(out_fd)
+    if copied_bytes != total:
+        raise OSError(f"Copied {copied_bytes} of {total} bytes from {src}")
+    # Only timestamps matter for save files; skip copystat's mode/flags/xattrs
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush directory entries (renames, unlinks) to disk where supported"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    dfd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dfd)
+    finally:
+        os.close(dfd)
+
+
+def _file_state(path: str | Path) -> Optional[List[int]]:
+    """Return a file's ``[size, mtime_ns]``, or None if it does not exist
+
+    Renames keep both values, so a journal can tell whether a target
+    already holds a staged file's data.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _try_lock(fd: int) -> bool:
+    """Take an exclusive lock on an open file without blocking"""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        elif msvcrt is not None:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fd: int) -> None:
+    """Release a lock taken with _try_lock"""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    elif msvcrt is not None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def _index_dir(save_dir: str | Path) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
+    """List a save directory once and group world files by world ID
+
+    Matches ``<id>-*`` and ``<id>_info-*`` file names and returns the
+    files of each world along with each world's ``-index`` file.
+    """
+    world_files: Dict[str, List[str]] = defaultdict(list)
+    index_files: Dict[str, str] = {}
+    with os.scandir(save_dir) as it:
+        for entry in it:
+            name = entry.name
+            # Hidden files are our own temporary copies and journals
+            if name.startswith("."):
+                continue
+            world_id, is_info, _ = name.partition("_info-")
+            if not is_info:
+                world_id, has_dash, _ = name.partition("-")
+                if not has_dash:
+                    continue
+            if not entry.is_file():
+                continue
+            world_files[world_id].append(entry.path)
+            if not is_info and name.endswith("-index"):
+                index_files.setdefault(world_id, entry.path)
+    for files in world_files.values():
+        files.sort()
+    return world_files, index_files
+
+
+def _write_synced(path: str | Path, data: bytes) -> None:
+    """Write a new file and flush it to disk"""
+    with open(path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Replace a file's contents so readers see either the old or new version
+
+    The data goes to a hidden temporary file that is fsynced and renamed
+    over ``path``; the directory is then fsynced so the rename is durable.
+    """
+    tmp = path.with_name(f".{path.name}.tmp.{uuid.uuid4().hex}")
+    try:
+        _write_synced(tmp, data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _fsync_dir(path.parent)
+
+
+@dataclass(slots=True, frozen=True)
 class WorldInfo:
     """Store world information with validation"""
     id: str
     name: str
     path: Path
-    index_data: dict
+    index_data: Mapping[str, Any]
     is_deleted: bool = False
     last_played: int = 0
     created_at: int = 0
-    
-    @property
-    def files(self) -> List[Path]:
-        """Get all files associated with this world"""
-        return sorted(
-            list(self.path.glob(f"{self.id}-*")) +
-            list(self.path.glob(f"{self.id}_info-*"))
-        )
+    # Paths of all files associated with this world, gathered by
+    # WorldManager.scan_worlds and kept as str straight from os.scandir
+    files: List[str] = field(default_factory=list)
+    # Friendly name with last played time, formatted once on creation
+    display_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.last_played:
+            played = datetime.fromtimestamp(self.last_played)
+            display_name = f"{self.name} (Last played: {played:%Y-%m-%d %H:%M})"
+        else:
+            display_name = self.name or f"World {self.id[:6]}"
+        # The dataclass is frozen, so bypass its __setattr__
+        object.__setattr__(self, "display_name", display_name)
     
     @property
     def is_valid(self) -> bool:
         """Check if world is valid and not deleted"""
         return not self.is_deleted and bool(self.files)
-    
-    @property
-    def display_name(self) -> str:
-        """Get a friendly display name with last played time"""
-        if self.last_played:
-            time_str = time.strftime('%Y-%m-%d %H:%M', time.localtime(self.last_played))
-            return f"{self.name} (Last played: {time_str})"
-        return self.name or f"World {self.id[:6]}"
 
 class WorldManager:
     """Handles world file operations and metadata management"""
     METADATA_FILE = "enshrouded_user.json"
+    JOURNAL_PREFIX = ".wd_journal_"
+    # Held while duplicating or recovering; the OS drops it if we crash
+    LOCK_FILE = ".wd_lock"
+    # IDs with an index file that are not worlds
+    EXCLUDED_IDS = frozenset({"characters"})
     
     def __init__(self, save_dir: Optional[Path] = None):
         self.save_dir = Path(save_dir) if save_dir else None
         self.worlds: Dict[str, WorldInfo] = {}
         self.metadata: Dict = {}
+        # Serialized metadata as last written, to skip no-op rewrites
+        self._metadata_bytes: Optional[bytes] = None
+        # [size, mtime_ns] of the metadata file when it was read
+        self._metadata_state: Optional[List[int]] = None
+        # Entries of metadata["worlds"] by world ID (same dict objects)
+        self._meta_by_id: Dict[str, Dict] = {}
         self._world_list_cache: List[Tuple[str, str]] = []
+        # Directory state the cached world list was built from
+        self._scan_fingerprint: Optional[Tuple] = None
+        # Parsed JSON files keyed by path string, tagged with (size, mtime_ns)
+        self._json_cache: Dict[str, Tuple[int, int, object]] = {}
         
-    def set_save_directory(self, path: str | Path) -> None:
-        """Set and validate the save directory"""
+    def set_save_directory(self, path: str | Path, recover: bool = True) -> None:
+        """Set and validate the save directory
+
+        Unless ``recover`` is False, duplications interrupted earlier are
+        completed first. That is skipped while another process holds the
+        save directory's lock.
+        """
         path = Path(path)
         if not path.exists():
             raise ValueError(f"Save directory does not exist: {path}")
@@ -111,59 +485,234 @@ class WorldManager:
             raise ValueError(f"Not a valid Enshrouded save directory (missing {self.METADATA_FILE})")
             
         self.save_dir = path
+        if recover:
+            with self._lock() as locked:
+                if locked:
+                    self._recover_journals()
+                else:
+                    logger.info("Save directory in use, skipping recovery: %s", path)
+        self._reload()
+
+    def _reload(self) -> None:
+        """Read the metadata again and rescan the worlds"""
+        metadata_file = self.save_dir / self.METADATA_FILE
+        # Taken before reading, so a concurrent change is seen as one later
+        self._metadata_state = _file_state(metadata_file)
         self.metadata = self._read_metadata()
+        self._metadata_bytes = None
+        self._meta_by_id = {
+            world.get("id"): world for world in self.metadata.get("worlds", [])
+        }
+        self._scan_fingerprint = None
         self.scan_worlds()
+
+    @contextlib.contextmanager
+    def _lock(self):
+        """Hold the save directory's lock file
+
+        Yields False instead of waiting if another process holds it.
+        """
+        with open(self.save_dir / self.LOCK_FILE, 'a+b') as f:
+            if not _try_lock(f.fileno()):
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                _unlock(f.fileno())
+
+    def _pending_journals(self) -> List[Path]:
+        """Journals of commits that were not completed"""
+        with os.scandir(self.save_dir) as it:
+            return [Path(entry.path) for entry in it if entry.name.startswith(self.JOURNAL_PREFIX)]
     
+    def _write_journal(self, entries: List[Dict]) -> Path:
+        """Durably record the renames and removals of a pending commit
+
+        Each entry maps a ``target`` file name to the ``tmp`` file that
+        replaces it, or has no ``tmp`` if the target is to be removed.
+        Replacements also record the ``[size, mtime_ns]`` of the target as
+        ``old`` and of the temporary file as ``new``, so recovery can tell
+        which renames happened and whether a target changed since.
+        """
+        journal = self.save_dir / f"{self.JOURNAL_PREFIX}{uuid.uuid4().hex}"
+        _atomic_write(journal, _dumps_json(entries))
+        return journal
+
+    def _apply_journal(self, entries: List[Dict], skip: frozenset = frozenset()) -> None:
+        """Carry out journal entries, except those whose target is in ``skip``
+
+        A missing temporary file raises and later entries are left undone.
+        """
+        for entry in entries:
+            if entry["target"] in skip:
+                continue
+            target = self.save_dir / entry["target"]
+            tmp_name = entry.get("tmp")
+            if tmp_name is None:
+                target.unlink(missing_ok=True)
+                continue
+            os.replace(self.save_dir / tmp_name, target)
+        _fsync_dir(self.save_dir)
+
+    def _recover(self, journal: Path, entries: List[Dict]) -> bool:
+        """Finish or drop a commit interrupted after its journal was written
+
+        A missing temporary file counts as renamed only if its target holds
+        the staged data. Targets changed by something else since the
+        journal was written are kept as they are, and if no rename had
+        happened yet the whole commit is dropped as outdated. Returns False,
+        keeping the journal, if the commit cannot be completed safely.
+        """
+        applied = set()
+        changed = set()
+        for entry in entries:
+            tmp_name = entry.get("tmp")
+            if tmp_name is None:
+                continue
+            state = _file_state(self.save_dir / entry["target"])
+            if (self.save_dir / tmp_name).exists():
+                if state != entry["old"]:
+                    changed.add(entry["target"])
+            elif state == entry["new"]:
+                applied.add(entry["target"])
+            else:
+                logger.error(
+                    "Cannot complete %s: %s is gone but %s does not hold its data",
+                    journal.name, tmp_name, entry["target"],
+                )
+                return False
+
+        if changed and not applied:
+            journal.unlink()
+            logger.warning(
+                "Dropped outdated %s; changed since: %s", journal.name, ", ".join(sorted(changed))
+            )
+            return True
+        if changed:
+            logger.warning(
+                "Kept newer %s while completing %s", ", ".join(sorted(changed)), journal.name
+            )
+        self._apply_journal(entries, skip=frozenset(applied | changed))
+        journal.unlink()
+        logger.info("Recovered interrupted duplication from %s", journal.name)
+        return True
+
+    def _recover_journals(self) -> None:
+        """Complete interrupted commits and drop copies that never got committed
+
+        The caller must hold the save directory's lock, or this could
+        delete the temporary files of a duplication that is running.
+        """
+        journals = []
+        tmp_files = []
+        with os.scandir(self.save_dir) as it:
+            for entry in it:
+                if entry.name.startswith(self.JOURNAL_PREFIX):
+                    journals.append(Path(entry.path))
+                elif entry.name.startswith(".") and ".tmp." in entry.name:
+                    tmp_files.append(Path(entry.path))
+        journals.sort(key=lambda journal: journal.stat().st_mtime_ns)
+
+        # Temporary files of journals that could not be completed; they are
+        # kept so a later attempt can still finish the commit
+        pending = set()
+        for journal in journals:
+            try:
+                entries = _loads_json(journal.read_bytes())
+            except Exception as e:
+                logger.error("Failed to read journal %s: %s", journal, e)
+                # Without its entries, any temporary file may belong to it
+                return
+            try:
+                completed = self._recover(journal, entries)
+            except Exception as e:
+                logger.error("Failed to recover from journal %s: %s", journal, e)
+                completed = False
+            if not completed:
+                pending.update(entry.get("tmp") for entry in entries)
+
+        # Other temporary copies still around after recovery were never committed
+        for tmp in tmp_files:
+            if tmp.name not in pending and tmp.exists():
+                tmp.unlink()
+                logger.info("Removed incomplete copy %s", tmp.name)
+
+    def _read_json_cached(self, path: str | Path):
+        """Parse a JSON file, reusing the last result while the file is unchanged
+
+        A deep copy is returned so callers can mutate it freely.
+        """
+        path = os.fspath(path)
+        st = os.stat(path)
+        cached = self._json_cache.get(path)
+        if cached and cached[:2] == (st.st_size, st.st_mtime_ns):
+            return copy.deepcopy(cached[2])
+        with open(path, 'rb') as f:
+            data = _loads_json(f.read())
+        self._json_cache[path] = (st.st_size, st.st_mtime_ns, data)
+        return copy.deepcopy(data)
+
     def _read_metadata(self) -> Dict:
         """Read and parse metadata file"""
         try:
             metadata_file = self.save_dir / self.METADATA_FILE
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return self._read_json_cached(metadata_file)
         except Exception as e:
-            logging.error(f"Failed to read metadata: {e}")
+            logger.error("Failed to read metadata: %s", e)
             return {}
     
-    def _read_index_file(self, path: Path) -> dict:
+    def _read_index_file(self, path: str | Path) -> dict:
         """Read and parse world index file"""
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return self._read_json_cached(path)
         except Exception as e:
-            logging.error(f"Failed to read index file {path}: {e}")
+            logger.error("Failed to read index file %s: %s", path, e)
             return {}
     
     def _get_world_metadata(self, world_id: str) -> Tuple[str, int, int]:
         """Get world name and timestamps from metadata"""
-        if "worlds" not in self.metadata:
+        world = self._meta_by_id.get(world_id)
+        if world is None:
             return "", 0, 0
-            
-        for world in self.metadata["worlds"]:
-            if world.get("id") == world_id:
-                return (
-                    world.get("name", ""),
-                    world.get("createdAt", 0),
-                    world.get("lastPlayed", 0)
-                )
-        return "", 0, 0
+        return (
+            world.get("name", ""),
+            world.get("createdAt", 0),
+            world.get("lastPlayed", 0)
+        )
     
     def scan_worlds(self) -> List[Tuple[str, str]]:
         """Scan save directory for worlds and return list of (display_name, id) tuples"""
         if not self.save_dir:
             raise RuntimeError("Save directory not set")
             
+        world_files, index_files = _index_dir(self.save_dir)
+
+        index_mtimes = []
+        for world_id, path in list(index_files.items()):
+            try:
+                index_mtimes.append((path, os.stat(path).st_mtime_ns))
+            except OSError:
+                # Removed since the directory was listed
+                del index_files[world_id]
+
+        # Reuse the previous result while no world file was added, removed
+        # or had its index rewritten
+        fingerprint = (
+            tuple(sorted(index_mtimes)),
+            tuple(sorted(path for files in world_files.values() for path in files)),
+        )
+        if fingerprint == self._scan_fingerprint:
+            return self._world_list_cache
+
         self.worlds.clear()
-        processed_ids = set()  # Track processed world IDs
         world_list = []
         
-        # Find all world IDs by scanning for index files
-        for index_file in self.save_dir.glob("*-index"):
-            world_id = index_file.name.split('-')[0]
-            if world_id == "characters" or world_id in processed_ids:  # Skip characters file and duplicates
+        # Every world has an index file; there is at most one per world ID
+        for world_id, index_file in index_files.items():
+            if world_id in self.EXCLUDED_IDS:
                 continue
                 
-            processed_ids.add(world_id)
-            
             # Read index file
             index_data = self._read_index_file(index_file)
             is_deleted = index_data.get("deleted", False)
@@ -176,10 +725,11 @@ class WorldManager:
                 id=world_id,
                 name=name,
                 path=self.save_dir,
-                index_data=index_data,
+                index_data=MappingProxyType(index_data),
                 is_deleted=is_deleted,
                 last_played=last_played,
-                created_at=created_at
+                created_at=created_at,
+                files=world_files[world_id],
             )
             
             if world_info.is_valid:
@@ -187,16 +737,106 @@ class WorldManager:
                 world_list.append((world_info.display_name, world_id))
                 
         self._world_list_cache = sorted(world_list, key=lambda x: x[0].lower())
+        name_to_id: Dict[str, str] = {}
+        for display_name, world_id in self._world_list_cache:
+            other_id = name_to_id.setdefault(display_name, world_id)
+            if other_id != world_id:
+                logger.warning(
+                    "Worlds %s and %s share the display name %r", other_id, world_id, display_name
+                )
+        self._scan_fingerprint = fingerprint
         return self._world_list_cache
     
+    def _copy_world_files(
+        self,
+        source_id: str,
+        target_id: str,
+        staged: List[Tuple[str, str]],
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        copy_progress: Optional[Callable[[int, int], None]] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> None:
+        """Copy source world files next to the target under temporary names
+
+        Each ``(temporary file, final path)`` pair is appended to ``staged``
+        before any copy starts so the caller can clean up after a failure.
+        The source's ``-index`` file is skipped, as duplicate_world writes
+        the target index itself. Worlds with more than two files are copied
+        on a small thread pool so the per-file I/O overlaps.
+        """
+        save_dir = os.fspath(self.save_dir)
+        source_index = f"{source_id}-index"
+        source_files = [
+            file for file in self.worlds[source_id].files
+            if os.path.basename(file) != source_index
+        ]
+        total_steps = len(source_files)
+
+        # (source file, temporary file, progress message) per copy
+        jobs: List[Tuple[str, str, str]] = []
+        for source_file in source_files:
+            source_name = os.path.basename(source_file)
+            new_name = source_name.replace(source_id, target_id)
+            target_file = os.path.join(save_dir, new_name)
+            tmp_file = os.path.join(save_dir, f".{new_name}.tmp.{uuid.uuid4().hex}")
+            staged.append((tmp_file, target_file))
+            jobs.append((source_file, tmp_file, f"Copied {source_name} to {new_name}"))
+
+        def copied(current_step: int, message: str) -> None:
+            logger.info(message)
+            if progress_callback:
+                progress_callback(current_step, total_steps, message)
+
+        if len(jobs) <= 2:
+            for current_step, (source_file, tmp_file, message) in enumerate(jobs, start=1):
+                _fast_copy(source_file, tmp_file, progress=copy_progress, cancel=cancel)
+                copied(current_step, message)
+            return
+
+        # Set on the first failure or when the caller cancels, so copies
+        # already running stop at their next chunk
+        abort = threading.Event()
+
+        def on_copy_progress(copied_bytes: int, total: int) -> None:
+            if copy_progress:
+                copy_progress(copied_bytes, total)
+            if cancel is not None and cancel.is_set():
+                abort.set()
+
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+            futures = {
+                executor.submit(
+                    _fast_copy, source_file, tmp_file, progress=on_copy_progress, cancel=abort
+                ): message
+                for source_file, tmp_file, message in jobs
+            }
+            try:
+                for current_step, future in enumerate(as_completed(futures), start=1):
+                    future.result()
+                    copied(current_step, futures[future])
+            except BaseException:
+                abort.set()
+                # Don't start copies that are still queued behind the failure
+                executor.shutdown(cancel_futures=True)
+                raise
+
     def duplicate_world(
         self,
         source_id: str,
         target_id: str,
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
-    ) -> Optional[Path]:
+        copy_progress: Optional[Callable[[int, int], None]] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Optional[List[Path]]:
         """Copy world files and update metadata
 
+        Source files, the new target index and the updated metadata are
+        first written to hidden temporary files next to the target. Once
+        all of them are written, a journal listing the renames is saved and
+        the files are renamed into place. A failure before that leaves the
+        target world untouched. An interrupted rename is completed by the
+        next set_save_directory call.
+
         Parameters
         ----------
         source_id: str
@@ -204,125 +844,197 @@ class WorldManager:
         target_id: str
             ID of the world to overwrite
         progress_callback: Callable[[int, int, str], None], optional
-            Callback invoked after each file move/copy with the current step,
+            Callback invoked after each file copy with the current step,
             total steps and a human readable message. Use this to update
             progress bars or print verbose output.
+        copy_progress: Callable[[int, int], None], optional
+            Callback invoked while a file is copied with the bytes copied so
+            far and the size of that file.
+        cancel: threading.Event, optional
+            When set before the copied files are swapped in, duplication
+            stops and the target world is left untouched.
+
+        Returns
+        -------
+        List[Path] or None
+            The target world files written, or None if duplication failed.
+
+        Raises
+        ------
+        RuntimeError
+            If another process holds the save directory, an earlier
+            duplication could not be completed, or renaming the files into
+            place failed part way. In the last case the journal is kept so
+            the duplication is finished on the next load.
         """
+        with self._lock() as locked:
+            if not locked:
+                raise RuntimeError("The save folder is in use by another World Duplicator")
+            return self._duplicate_world(
+                source_id, target_id, progress_callback, copy_progress, cancel
+            )
+
+    def _duplicate_world(
+        self,
+        source_id: str,
+        target_id: str,
+        progress_callback: Optional[Callable[[int, int, str], None]],
+        copy_progress: Optional[Callable[[int, int], None]],
+        cancel: Optional[threading.Event],
+    ) -> Optional[List[Path]]:
+        """Body of duplicate_world, run while holding the lock"""
+        metadata_file = os.path.join(os.fspath(self.save_dir), self.METADATA_FILE)
+
+        # Finish earlier commits first, so their journals can never be
+        # replayed over this one later
+        if self._pending_journals():
+            self._recover_journals()
+            self._reload()
+            if self._pending_journals():
+                raise RuntimeError(
+                    "An earlier duplication could not be completed. Check the log file."
+                )
+        elif _file_state(metadata_file) != self._metadata_state:
+            # Pick up changes the game made, such as new worlds
+            self._reload()
+
         if not (source_id in self.worlds and target_id in self.worlds):
-            logging.error(f"Invalid world IDs - source: {source_id}, target: {target_id}")
+            logger.error("Invalid world IDs - source: %s, target: %s", source_id, target_id)
             return None
 
         source = self.worlds[source_id]
         target = self.worlds[target_id]
+        save_dir = os.fspath(self.save_dir)
 
-        # Track file operations for potential rollback
-        moved_files: List[Tuple[Path, Path]] = []
-        copied_files: List[Path] = []
-        backup_dir: Optional[Path] = None
+        # (temporary file, final path) pairs staged for the atomic rename
+        staged: List[Tuple[str, str]] = []
+
+        def stage(name: str, data: bytes) -> None:
+            target_file = os.path.join(save_dir, name)
+            tmp_file = os.path.join(save_dir, f".{name}.tmp.{uuid.uuid4().hex}")
+            staged.append((tmp_file, target_file))
+            _write_synced(tmp_file, data)
+
+        # Target's metadata entry as it was, restored if nothing is committed
+        world = self._meta_by_id.get(target_id)
+        previous_entry = dict(world) if world is not None else None
+        metadata_data = None
 
         try:
-            # Determine total operations for progress reporting
-            total_steps = len(target.files) + len(source.files)
-            current_step = 0
-
-            # Move existing target files to backup
-            timestamp = time.strftime('%Y%m%d%H%M%S')
-            backup_dir = self.save_dir / f"{target_id}_backup_{timestamp}"
-            backup_dir.mkdir(parents=True, exist_ok=True)
-            for file in target.files:
-                dest = backup_dir / file.name
-                shutil.move(str(file), dest)
-                moved_files.append((file, dest))
-                current_step += 1
-                message = f"Moved {file.name} to {backup_dir}"
-                logging.info(message)
-                if progress_callback:
-                    progress_callback(current_step, total_steps, message)
-            logging.info(f"Backup of target world created at {backup_dir}")
-
-            # Copy all source files to target
-            for source_file in source.files:
-                new_name = source_file.name.replace(source_id, target_id)
-                target_file = self.save_dir / new_name
-                shutil.copy2(source_file, target_file)
-                copied_files.append(target_file)
-                current_step += 1
-                message = f"Copied {source_file.name} to {target_file.name}"
-                logging.info(message)
-                if progress_callback:
-                    progress_callback(current_step, total_steps, message)
-
-            # Update target's index file with new timestamp and any additional data
-            target_index = self.save_dir / f"{target_id}-index"
-            if target_index.exists():
-                index_data = self._read_index_file(target_index)
-                index_data["time"] = int(time.time())
-                index_data["deleted"] = False
-                index_data["latest"] = source.index_data.get("latest", 0)
-
-                # Copy any additional fields from source index data to target index data
-                for key, value in source.index_data.items():
-                    if key not in ["id", "time", "deleted"]:
-                        index_data[key] = value
-                        logging.info(f"Copied {key}: {value}")
-
-                target_index.write_text(json.dumps(index_data, indent=2))
-
-            # Update metadata file
+            self._copy_world_files(
+                source_id, target_id, staged, progress_callback, copy_progress, cancel
+            )
+            if cancel is not None and cancel.is_set():
+                raise CancelledError("Duplication cancelled")
+
+            # Source index fields carried over to the target index and metadata
+            extra_fields = {
+                key: value
+                for key, value in source.index_data.items()
+                if key not in _INDEX_SKIP_FIELDS
+            }
+            logger.info("Copying source fields: %s", ", ".join(extra_fields))
+            current_time = int(time.time())
+
+            # Build target's index from the source index we already hold
+            index_data = {
+                **extra_fields,
+                "id": target_id,
+                "time": current_time,
+                "deleted": False,
+                "latest": source.index_data.get("latest", 0),
+            }
+            stage(f"{target_id}-index", _dumps_json(index_data))
+            written = [target_file for _, target_file in staged]
+
+            # Update metadata, skipping the write if nothing changed
+            if world is not None:
+                world["name"] = f"Copy of {source.name}"
+                world["lastPlayed"] = current_time
+                # Copy any additional fields from source metadata to target metadata
+                world.update(extra_fields)
             if "worlds" in self.metadata:
-                current_time = int(time.time())
-                for world in self.metadata["worlds"]:
-                    if world["id"] == target_id:
-                        world["name"] = f"Copy of {source.name}"
-                        world["lastPlayed"] = current_time
-                        # Copy any additional fields from source metadata to target metadata
-                        for key, value in source.index_data.items():
-                            if key not in ["id", "time", "deleted"]:
-                                world[key] = value
-                                logging.info(f"Copied {key} to metadata: {value}")
-                        break
-
-                metadata_file = self.save_dir / self.METADATA_FILE
-                with open(metadata_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.metadata, f, indent=2)
-
-            logging.info(f"Successfully duplicated world {source_id} to {target_id}")
-            return backup_dir
+                metadata_data = _dumps_json(self.metadata)
+                if metadata_data != self._metadata_bytes:
+                    stage(self.METADATA_FILE, metadata_data)
+
+            # Everything is written, so record the swap and drop target files
+            # the source world does not have. The journal lets
+            # set_save_directory finish the renames if we are interrupted.
+            if _file_state(metadata_file) != self._metadata_state:
+                raise RuntimeError("The metadata file changed during duplication")
+            entries = [
+                {
+                    "target": os.path.basename(target_file),
+                    "tmp": os.path.basename(tmp_file),
+                    "old": _file_state(target_file),
+                    "new": _file_state(tmp_file),
+                }
+                for tmp_file, target_file in staged
+            ]
+            entries.extend(
+                {"target": os.path.basename(file)}
+                for file in target.files
+                if file not in written
+            )
+            journal = self._write_journal(entries)
+            # From here on the temporary files belong to the journal
+            staged.clear()
 
         except Exception as e:
-            logging.error(f"Failed to duplicate world: {e}")
-            rollback_success = True
-            try:
-                # Remove any partially copied files
-                for path in copied_files:
-                    if path.exists():
-                        path.unlink()
-
-                # Restore moved files from backup
-                for original, backup in moved_files:
-                    if backup.exists():
-                        shutil.move(str(backup), original)
-
-                # Clean up backup directory if empty
-                if backup_dir and backup_dir.exists():
-                    try:
-                        backup_dir.rmdir()
-                    except OSError:
-                        pass
-
-                logging.info("Rollback successful")
-            except Exception as rollback_error:
-                rollback_success = False
-                logging.error(f"Rollback failed: {rollback_error}")
-            if rollback_success:
-                logging.info("Rollback completed without errors")
+            logger.error("Failed to duplicate world: %s", e)
+            if world is not None:
+                world.clear()
+                world.update(previous_entry)
+            # Remove any temporary files that were not renamed into place
+            for tmp_file, _ in staged:
+                try:
+                    os.remove(tmp_file)
+                except FileNotFoundError:
+                    pass
+                except OSError as cleanup_error:
+                    logger.error("Failed to remove %s: %s", tmp_file, cleanup_error)
             return None
 
+        self._scan_fingerprint = None
+        for file in (*written, metadata_file):
+            self._json_cache.pop(file, None)
+        try:
+            self._apply_journal(entries)
+            journal.unlink()
+        except OSError as e:
+            # Some files may already be replaced; the journal stays behind so
+            # the next set_save_directory completes the duplication
+            self._metadata_bytes = None
+            logger.error(
+                "Duplication of %s to %s interrupted, kept %s: %s",
+                source_id, target_id, journal.name, e,
+            )
+            raise RuntimeError(
+                f"Duplication was interrupted ({e}). It will be completed the next "
+                "time this save folder is opened."
+            ) from e
+
+        if metadata_data is not None:
+            self._metadata_bytes = metadata_data
+            self._metadata_state = _file_state(metadata_file)
+        logger.info("Successfully duplicated world %s to %s", source_id, target_id)
+        return [Path(file) for file in written]
+
 class WorldDuplicatorGUI:
     """GUI for world duplication"""
     def __init__(self, auto_confirm: bool = False):
         self.world_manager = WorldManager()
         self.auto_confirm = auto_confirm
+        # Duplication runs off the Tk thread; progress comes back via a queue
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._progress_queue: "queue.Queue[Tuple[int, int, str]]" = queue.Queue()
+        self._duplication: Optional[Future] = None
+        self._cancel_event = threading.Event()
+        # Latest (bytes copied, file size) from the worker; polled, not queued
+        self._file_progress: Optional[Tuple[int, int]] = None
+        # World IDs in listbox order; display names need not be unique
+        self._world_ids: List[str] = []
         self.setup_gui()
 
         # Attempt to automatically detect the save directory
@@ -334,9 +1046,10 @@ class WorldDuplicatorGUI:
                 self.refresh_world_lists()
                 self.status_label.config(text="Detected save directory")
             except Exception as e:
-                logging.error(f"Auto-detect failed: {e}")
+                logger.error("Auto-detect failed: %s", e)
         
     def setup_gui(self):
+        _import_tk()
         self.root = tk.Tk()
         self.root.title("Enshrouded World Duplicator")
         self.root.geometry("1000x600")
@@ -355,8 +1068,9 @@ class WorldDuplicatorGUI:
         self.folder_label = ttk.Label(folder_frame, text="No save folder selected", wraplength=800)
         self.folder_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
-        ttk.Button(folder_frame, text="Select Save Folder", 
-                  command=self.select_save_folder).pack(side=tk.RIGHT)
+        self.folder_button = ttk.Button(folder_frame, text="Select Save Folder",
+                                        command=self.select_save_folder)
+        self.folder_button.pack(side=tk.RIGHT)
         
         # Create selection frames
         selection_frame = ttk.Frame(main_frame)
@@ -379,6 +1093,11 @@ class WorldDuplicatorGUI:
                                          state=tk.DISABLED)
         self.duplicate_button.pack()
 
+        self.cancel_button = ttk.Button(button_frame, text="Cancel",
+                                      command=self.cancel_duplication,
+                                      state=tk.DISABLED)
+        self.cancel_button.pack(pady=(5, 0))
+
         # Add status label
         self.status_label = ttk.Label(main_frame, text="", wraplength=800)
         self.status_label.pack(pady=(5, 0))
@@ -386,6 +1105,10 @@ class WorldDuplicatorGUI:
         # Progress bar for duplication
         self.progress_bar = ttk.Progressbar(main_frame, mode='determinate')
         self.progress_bar.pack(fill=tk.X, pady=(5, 0))
+
+        # Progress within the file currently being copied
+        self.file_progress_bar = ttk.Progressbar(main_frame, mode='determinate')
+        self.file_progress_bar.pack(fill=tk.X, pady=(5, 0))
     
     def create_world_frame(self, parent, title):
         frame = ttk.LabelFrame(parent, text=title, padding="5", style='World.TLabelframe')
@@ -411,6 +1134,8 @@ class WorldDuplicatorGUI:
     
     def select_save_folder(self):
         """Handle save folder selection"""
+        if self._duplication is not None:
+            return
         folder = filedialog.askdirectory(title="Select Enshrouded Save Folder")
         if not folder:
             return
@@ -428,33 +1153,32 @@ class WorldDuplicatorGUI:
     def refresh_world_lists(self):
         """Update both world lists"""
         worlds = self.world_manager.scan_worlds()
+        names = [display_name for display_name, _ in worlds]
+        self._world_ids = [world_id for _, world_id in worlds]
         
-        # Clear existing items
+        # Replace all items with one Tk call per list
         self.source_list.delete(0, tk.END)
         self.target_list.delete(0, tk.END)
-        
-        # Add unique entries
-        seen_names = set()
-        for display_name, _ in worlds:
-            if display_name not in seen_names:
-                seen_names.add(display_name)
-                self.source_list.insert(tk.END, display_name)
-                self.target_list.insert(tk.END, display_name)
+        self.source_list.insert(tk.END, *names)
+        self.target_list.insert(tk.END, *names)
 
     def update_progress(self, step: int, total: int, message: str) -> None:
         """Update progress bar and status label"""
         self.progress_bar.config(maximum=total, value=step)
         self.status_label.config(text=message)
-        self.root.update_idletasks()
 
     def check_selection(self, _=None):
-        """Enable/disable duplicate button based on selections"""
+        """Enable/disable buttons based on selections and running work"""
         source_sel = self.source_list.curselection()
         target_sel = self.target_list.curselection()
         
+        idle = self._duplication is None
         self.duplicate_button.config(
-            state=tk.NORMAL if source_sel and target_sel else tk.DISABLED
+            state=tk.NORMAL if idle and source_sel and target_sel else tk.DISABLED
         )
+        # Switching folders would pull the save directory out from under
+        # the running duplication
+        self.folder_button.config(state=tk.NORMAL if idle else tk.DISABLED)
     
     def duplicate_world(self):
         """Handle world duplication"""
@@ -464,58 +1188,86 @@ class WorldDuplicatorGUI:
         source_display = self.source_list.get(source_idx)
         target_display = self.target_list.get(target_idx)
         
-        if source_display == target_display:
+        # Resolve by position, as two worlds can share a display name
+        source_id = self._world_ids[source_idx]
+        target_id = self._world_ids[target_idx]
+        
+        if source_id == target_id:
             messagebox.showwarning("Warning", "Source and target worlds must be different")
             return
         
-        worlds = self.world_manager.scan_worlds()
-        source_id = next(id for name, id in worlds if name == source_display)
-        target_id = next(id for name, id in worlds if name == target_display)
-        
         if self.auto_confirm or messagebox.askyesno(
             "Confirm", f"Replace '{target_display}' with a copy of '{source_display}'?"
         ):
+            # Reset progress bars
+            self.progress_bar.config(value=0)
+            self.file_progress_bar.config(value=0)
+            self.status_label.config(text="Starting duplication...")
+            self._cancel_event.clear()
+            self._duplication = self._executor.submit(
+                self.world_manager.duplicate_world,
+                source_id,
+                target_id,
+                progress_callback=self._queue_progress,
+                copy_progress=self._set_file_progress,
+                cancel=self._cancel_event,
+            )
+            self.check_selection()
+            self.cancel_button.config(state=tk.NORMAL)
+            self.root.after(100, self._poll_duplication)
+
+    def _queue_progress(self, step: int, total: int, message: str) -> None:
+        """Hand progress from the worker thread to the Tk thread"""
+        self._progress_queue.put((step, total, message))
+
+    def _set_file_progress(self, copied: int, total: int) -> None:
+        """Record byte progress from the worker thread for the next poll"""
+        self._file_progress = (copied, total)
+
+    def cancel_duplication(self):
+        """Ask the running duplication to stop before it replaces the target"""
+        self._cancel_event.set()
+        self.cancel_button.config(state=tk.DISABLED)
+        self.status_label.config(text="Cancelling...")
+
+    def _poll_duplication(self):
+        """Apply queued progress and handle the result once duplication ends"""
+        while True:
             try:
-                # Reset progress bar
-                self.progress_bar.config(value=0)
-                self.status_label.config(text="Starting duplication...")
+                self.update_progress(*self._progress_queue.get_nowait())
+            except queue.Empty:
+                break
+        if self._file_progress:
+            copied, total = self._file_progress
+            self.file_progress_bar.config(maximum=max(total, 1), value=copied)
+
+        future = self._duplication
+        if not future.done():
+            self.root.after(100, self._poll_duplication)
+            return
 
-                backup_dir = self.world_manager.duplicate_world(
-                    source_id, target_id, progress_callback=self.update_progress
+        self._duplication = None
+        self._file_progress = None
+        self.cancel_button.config(state=tk.DISABLED)
+        try:
+            written = future.result()
+            if self._cancel_event.is_set() and not written:
+                self.status_label.config(text="Duplication cancelled")
+            elif written:
+                self.refresh_world_lists()
+                messagebox.showinfo("Success", "World duplicated successfully!")
+                self.status_label.config(text="World duplicated successfully")
+            else:
+                messagebox.showerror(
+                    "Error",
+                    "Failed to duplicate world. Check the log file."
                 )
-                if backup_dir:
-                    self.refresh_world_lists()
-                    messagebox.showinfo(
-                        "Success",
-                        f"World duplicated successfully!\nBackup saved at: {backup_dir}"
-                    )
-                    if not self.auto_confirm and messagebox.askyesno(
-                        "Delete Backup?", f"Delete backup at {backup_dir}?"
-                    ):
-                        try:
-                            shutil.rmtree(backup_dir)
-                            logging.info(f"Deleted backup at {backup_dir}")
-                            self.status_label.config(
-                                text="World duplicated successfully; backup deleted"
-                            )
-                        except Exception as e:
-                            logging.error(f"Failed to delete backup: {e}")
-                            self.status_label.config(
-                                text=f"World duplicated; failed to delete backup: {e}"
-                            )
-                    else:
-                        self.status_label.config(
-                            text=f"World duplicated successfully; backup at {backup_dir}"
-                        )
-                else:
-                    messagebox.showerror(
-                        "Error",
-                        "Failed to duplicate world. Check the log file."
-                    )
-                    self.status_label.config(text="Failed to duplicate world")
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
-                self.status_label.config(text=f"Error: {str(e)}")
+                self.status_label.config(text="Failed to duplicate world")
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            self.status_label.config(text=f"Error: {str(e)}")
+        finally:
+            self.check_selection()
 
 def main():
     """Entry point for CLI or GUI mode."""
@@ -553,15 +1305,16 @@ def main():
     if args.list:
         save_dir = args.save_dir
         if not save_dir:
-            logging.error("Save directory not specified and could not be guessed")
+            logger.error("Save directory not specified and could not be guessed")
             print("Error: save directory not specified and could not be guessed.")
             sys.exit(1)
 
         wm = WorldManager()
         try:
-            wm.set_save_directory(save_dir)
+            # Listing is read-only, so leave interrupted duplications alone
+            wm.set_save_directory(save_dir, recover=False)
         except Exception as e:
-            logging.error(f"Failed to load save directory: {e}")
+            logger.error("Failed to load save directory: %s", e)
             print(f"Error: {e}")
             sys.exit(1)
 
@@ -572,7 +1325,7 @@ def main():
     if args.source and args.target:
         save_dir = args.save_dir
         if not save_dir:
-            logging.error("Save directory not specified and could not be guessed")
+            logger.error("Save directory not specified and could not be guessed")
             print("Error: save directory not specified and could not be guessed.")
             sys.exit(1)
 
@@ -580,12 +1333,13 @@ def main():
         try:
             wm.set_save_directory(save_dir)
         except Exception as e:
-            logging.error(f"Failed to load save directory: {e}")
+            logger.error("Failed to load save directory: %s", e)
             print(f"Error: {e}")
             sys.exit(1)
 
         if not args.yes:
             if TK_AVAILABLE:
+                _import_tk()
                 root = tk.Tk()
                 root.withdraw()
                 proceed = messagebox.askyesno(
@@ -603,32 +1357,15 @@ def main():
                 sys.exit(0)
 
         progress_cb = print if args.verbose else None
-        backup_dir = wm.duplicate_world(
-            args.source, args.target, progress_callback=progress_cb
-        )
-        if backup_dir:
-            print(f"World duplicated successfully. Backup at {backup_dir}")
-            if not args.yes:
-                if TK_AVAILABLE:
-                    root = tk.Tk()
-                    root.withdraw()
-                    delete_backup = messagebox.askyesno(
-                        "Delete Backup?", f"Delete backup at {backup_dir}?"
-                    )
-                    root.destroy()
-                else:
-                    response = input(
-                        f"Delete backup at {backup_dir}? [y/N]: "
-                    ).strip().lower()
-                    delete_backup = response in {"y", "yes"}
-                if delete_backup:
-                    try:
-                        shutil.rmtree(backup_dir)
-                        logging.info(f"Deleted backup at {backup_dir}")
-                        print("Backup deleted.")
-                    except Exception as e:
-                        logging.error(f"Failed to delete backup: {e}")
-                        print(f"Failed to delete backup: {e}")
+        try:
+            written = wm.duplicate_world(
+                args.source, args.target, progress_callback=progress_cb
+            )
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        if written:
+            print("World duplicated successfully.")
             sys.exit(0)
         else:
             print("Failed to duplicate world. Check the log for details.")
@@ -1,10 +1,12 @@
+import errno
 import json
+import threading
 from pathlib import Path
 
 import pytest
 
 import world_duplicator
-from world_duplicator import WorldManager
+from world_duplicator import WorldManager, _file_state
 
 
 @pytest.fixture
@@ -60,28 +62,62 @@ def test_scan_worlds(sample_save_dir: Path) -> None:
     assert ids == {"world1", "world2"}
 
 
+def test_scan_worlds_duplicate_display_names(
+    sample_save_dir: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Ensure worlds sharing a display name are all listed and the clash is logged."""
+    metadata = json.loads((sample_save_dir / "enshrouded_user.json").read_text())
+    for world in metadata["worlds"]:
+        world["name"] = "Same Name"
+    (sample_save_dir / "enshrouded_user.json").write_text(json.dumps(metadata))
+
+    wm = WorldManager()
+    with caplog.at_level("WARNING", logger="world_duplicator"):
+        wm.set_save_directory(sample_save_dir)
+
+    assert sorted(world_id for _, world_id in wm.scan_worlds()) == ["world1", "world2"]
+    assert "share the display name" in caplog.text
+
+
+def test_scan_worlds_info_and_characters_files(sample_save_dir: Path) -> None:
+    """Ensure _info-* files belong to their world and characters files are not a world."""
+    (sample_save_dir / "world1_info-index").write_text("info")
+    (sample_save_dir / "world1_info-0").write_text("info data")
+    (sample_save_dir / "characters-index").write_text(json.dumps({"id": "characters"}))
+    (sample_save_dir / "characters-0").write_text("character")
+
+    wm = WorldManager()
+    wm.set_save_directory(sample_save_dir)
+
+    assert sorted(world_id for _, world_id in wm.scan_worlds()) == ["world1", "world2"]
+    assert sorted(Path(file).name for file in wm.worlds["world1"].files) == [
+        "world1-data",
+        "world1-index",
+        "world1_info-0",
+        "world1_info-index",
+    ]
+
+
 def test_duplicate_world(sample_save_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Target-only files should not survive the duplication
+    (sample_save_dir / "world2-extra").write_text("stale")
+
     wm = WorldManager()
     wm.set_save_directory(sample_save_dir)
 
     # Freeze time for predictable results
     monkeypatch.setattr(world_duplicator.time, "time", lambda: 1234567890)
-    monkeypatch.setattr(
-        world_duplicator.time, "strftime", lambda fmt: "20200101000000"
-    )
-
-    backup_dir = wm.duplicate_world("world1", "world2")
-    assert backup_dir is not None
-    assert backup_dir.is_dir()
 
-    # Original target files should be in the backup directory
-    assert (backup_dir / "world2-data").read_text() == "target"
-    assert (backup_dir / "world2-index").exists()
+    written = wm.duplicate_world("world1", "world2")
+    assert written is not None
+    assert sorted(p.name for p in written) == ["world2-data", "world2-index"]
 
     # Target files should now match source contents
     assert (sample_save_dir / "world2-data").read_text() == "source"
+    assert not (sample_save_dir / "world2-extra").exists()
 
     index_data = json.loads((sample_save_dir / "world2-index").read_text())
+    assert index_data["id"] == "world2"
     assert index_data["time"] == 1234567890
     assert index_data["deleted"] is False
     assert index_data["latest"] == 1
@@ -93,12 +129,13 @@ def test_duplicate_world(sample_save_dir: Path, monkeypatch: pytest.MonkeyPatch)
 
 
 def test_duplicate_world_rollback(sample_save_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    """Ensure target files are restored if duplication fails."""
+    """Ensure target files are untouched if duplication fails."""
+    (sample_save_dir / "world1-other").write_text("more")
     wm = WorldManager()
     wm.set_save_directory(sample_save_dir)
 
-    # Force shutil.copy2 to fail after first call
-    original_copy = world_duplicator.shutil.copy2
+    # Force the file copy to fail after first call
+    original_copy = world_duplicator._fast_copy
 
     def failing_copy(src, dst, *args, **kwargs):
         if failing_copy.called:
@@ -107,14 +144,453 @@ def test_duplicate_world_rollback(sample_save_dir: Path, monkeypatch: pytest.Mon
         return original_copy(src, dst, *args, **kwargs)
 
     failing_copy.called = False
-    monkeypatch.setattr(world_duplicator.shutil, "copy2", failing_copy)
+    monkeypatch.setattr(world_duplicator, "_fast_copy", failing_copy)
 
     result = wm.duplicate_world("world1", "world2")
     assert result is None
 
-    # Target files should be restored to their original state
+    # Target files should be left in their original state
     assert (sample_save_dir / "world2-data").read_text() == "target"
     assert (sample_save_dir / "world2-index").exists()
 
-    # No backup directories should remain
-    assert not any(sample_save_dir.glob("world2_backup_*"))
+    # No temporary copies should remain
+    assert not any(sample_save_dir.glob(".*.tmp.*"))
+
+
+def test_fast_copy_falls_back(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure files are still copied when kernel copy primitives are unavailable."""
+    src = tmp_path / "src"
+    src.write_bytes(b"x" * 100_000)
+    dst = tmp_path / "dst"
+
+    def unsupported(*args, **kwargs):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    monkeypatch.setattr(world_duplicator.os, "copy_file_range", unsupported, raising=False)
+    monkeypatch.setattr(world_duplicator.os, "sendfile", unsupported, raising=False)
+    monkeypatch.setattr(world_duplicator, "fcntl", None)
+
+    world_duplicator._fast_copy(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+def test_fast_copy_falls_back_after_empty_kernel_copy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure a kernel copy that reports EOF before copying anything is not trusted."""
+    src = tmp_path / "src"
+    src.write_bytes(b"x" * 5000)
+    dst = tmp_path / "dst"
+
+    monkeypatch.setattr(world_duplicator.os, "copy_file_range", lambda *args: 0, raising=False)
+    monkeypatch.setattr(world_duplicator, "fcntl", None)
+
+    world_duplicator._fast_copy(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_fast_copy_windows_streams(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure only the main stream counts on the CopyFileExW path and read-only is cleared."""
+    src = tmp_path / "src"
+    src.write_bytes(b"x" * 5000)
+    dst = tmp_path / "dst"
+
+    def fake_copy_file_ex(src_path, dst_path, routine, data, cancel, flags):
+        Path(dst_path).write_bytes(Path(src_path).read_bytes())
+        Path(dst_path).chmod(0o444)
+        # Main stream, then a 26-byte Zone.Identifier stream
+        routine(5026, 5000, 5000, 5000, 1, 0, None, None, None)
+        routine(5026, 5026, 26, 26, 2, 1, None, None, None)
+        return True
+
+    monkeypatch.setattr(world_duplicator, "_CopyFileExW", fake_copy_file_ex)
+    monkeypatch.setattr(world_duplicator, "_PROGRESS_ROUTINE", lambda f: f, raising=False)
+    progress = []
+
+    world_duplicator._fast_copy(src, dst, progress=lambda copied, total: progress.append(copied))
+    assert progress == [5000]
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mode & 0o200
+
+
+def test_recover_interrupted_duplication(sample_save_dir: Path) -> None:
+    """Ensure a commit interrupted after its journal was written is completed."""
+    (sample_save_dir / ".world2-data.tmp.abc").write_text("source")
+    (sample_save_dir / ".world2-extra.tmp.def").write_text("uncommitted")
+    (sample_save_dir / "world2-old").write_text("stale")
+    (sample_save_dir / ".wd_journal_123").write_text(
+        json.dumps(
+            [
+                {
+                    "target": "world2-data",
+                    "tmp": ".world2-data.tmp.abc",
+                    "old": _file_state(sample_save_dir / "world2-data"),
+                    "new": _file_state(sample_save_dir / ".world2-data.tmp.abc"),
+                },
+                {"target": "world2-old"},
+            ]
+        )
+    )
+
+    wm = WorldManager()
+    wm.set_save_directory(sample_save_dir)
+
+    assert (sample_save_dir / "world2-data").read_text() == "source"
+    assert not (sample_save_dir / "world2-old").exists()
+    assert not (sample_save_dir / ".wd_journal_123").exists()
+    assert not any(sample_save_dir.glob(".*.tmp.*"))
+
+
+def test_duplicate_world_interrupted_rename(
+    sample_save_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure a failed rename is reported and finished consistently on the next load."""
+    wm = WorldManager()
+    wm.set_save_directory(sample_save_dir)
+
+    original_replace = world_duplicator.os.replace
+    calls = []
+
+    def failing_replace(src, dst):
+        calls.append(dst)
+        # The journal write and the first staged rename go through
+        if len(calls) == 3:
+            raise OSError("rename failed")
+        return original_replace(src, dst)
+
+    with monkeypatch.context() as m:
+        m.setattr(world_duplicator.os, "replace", failing_replace)
+        with pytest.raises(RuntimeError):
+            wm.duplicate_world("world1", "world2")
+    assert (sample_save_dir / "world2-data").read_text() == "source"
+    assert json.loads((sample_save_dir / "world2-index").read_text())["latest"] == 2
+
+    WorldManager().set_save_directory(sample_save_dir)
+
+    assert (sample_save_dir / "world2-data").read_text() == "source"
+    index_data = json.loads((sample_save_dir / "world2-index").read_text())
+    assert index_data["id"] == "world2"
+    assert index_data["latest"] == 1
+    metadata = json.loads((sample_save_dir / "enshrouded_user.json").read_text())
+    world2_meta = next(w for w in metadata["worlds"] if w["id"] == "world2")
+    assert world2_meta["name"] == "Copy of World One"
+    assert not any(sample_save_dir.glob(".wd_journal_*"))
+    assert not any(sample_save_dir.glob(".*.tmp.*"))
+
+
+def test_apply_journal_missing_tmp(sample_save_dir: Path) -> None:
+    """Ensure a live commit stops at a missing temporary file instead of skipping it."""
+    wm = WorldManager()
+    wm.set_save_directory(sample_save_dir)
+
+    with pytest.raises(FileNotFoundError):
+        wm._apply_journal(
+            [
+                {"target": "world2-data", "tmp": ".world2-data.tmp.gone"},
+                {"target": "world2-index"},
+            ]
+        )
+    assert (sample_save_dir / "world2-data").read_text() == "target"
+    assert (sample_save_dir / "world2-index").exists()
+
+
+def test_recovery_failure_keeps_journal_files(
+    sample_save_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure temporary files of a journal that could not be replayed are kept."""
+    (sample_save_dir / ".world2-data.tmp.abc").write_text("source")
+    (sample_save_dir / ".world2-extra.tmp.def").write_text("uncommitted")
+    (sample_save_dir / ".wd_journal_123").write_text(
+        json.dumps(
+            [
+                {
+                    "target": "world2-data",
+                    "tmp": ".world2-data.tmp.abc",
+                    "old": _file_state(sample_save_dir / "world2-data"),
+                    "new": _file_state(sample_save_dir / ".world2-data.tmp.abc"),
+                }
+            ]
+        )
+    )
+
+    def failing_replace(src, dst):
+        raise OSError("rename failed")
+
+    with monkeypatch.context() as m:
+        m.setattr(world_duplicator.os, "replace", failing_replace)
+        WorldManager().set_save_directory(sample_save_dir)
+
+    assert (sample_save_dir / ".world2-data.tmp.abc").exists()
+    assert not (sample_save_dir / ".world2-extra.tmp.def").exists()
+
+    WorldManager().set_save_directory(sample_save_dir)
+    assert (sample_save_dir / "world2-data").read_text() == "source"
+    assert not (sample_save_dir / ".wd_journal_123").exists()
+
+
+def _fail_first_staged_rename(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make the rename after the journal write fail, as when the game holds a file."""
+    original_replace = world_duplicator.os.replace
+    calls = []
+
+    def failing_replace(src, dst):
+        calls.append(dst)
+        if len(calls) == 2:
+            raise PermissionError("file in use")
+        return original_replace(src, dst)
+
+    monkeypatch.setattr(world_duplicator.os, "replace", failing_replace)
+
+
+def test_failed_commit_then_new_duplication(
+    sample_save_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure a pending journal is finished before a new duplication, never replayed after it."""
+    metadata = json.loads((sample_save_dir / "enshrouded_user.json").read_text())
+    metadata["worlds"].append(
+        {"id": "world3", "name": "World Three", "createdAt": 0, "lastPlayed": 0}
+    )
+    (sample_save_dir / "enshrouded_user.json").write_text(json.dumps(metadata))
+    (sample_save_dir / "world3-index").write_text(json.dumps({"id": "world3", "latest": 3}))
+    (sample_save_dir / "world3-data").write_text("third")
+
+    wm = WorldManager()
+    wm.set_save_directory(sample_save_dir)
+    with monkeypatch.context() as m:
+        _fail_first_staged_rename(m)
+        with pytest.raises(RuntimeError):
+            wm.duplicate_world("world1", "world2")
+
+    assert wm.duplicate_world("world3", "world2") is not None
+    assert not any(sample_save_dir.glob(".wd_journal_*"))
+
+    # The game adds a world before the folder is opened again
+    metadata = json.loads((sample_save_dir / "enshrouded_user.json").read_text())
+    metadata["worlds"].append(
+        {"id": "world4", "name": "World Four", "createdAt": 0, "lastPlayed": 0}
+    )
+    (sample_save_dir / "enshrouded_user.json").write_text(json.dumps(metadata))
+    WorldManager().set_save_directory(sample_save_dir)
+
+    assert (sample_save_dir / "world2-data").read_text() == "third"
+    assert json.loads((sample_save_dir / "world2-index").read_text())["latest"] == 3
+    metadata = json.loads((sample_save_dir / "enshrouded_user.json").read_text())
+    assert {w["id"] for w in metadata["worlds"]} == {"world1", "world2", "world3", "world4"}
+    world2_meta = next(w for w in metadata["worlds"] if w["id"] == "world2")
+    assert world2_meta["name"] == "Copy of World Three"
+
+
+def test_outdated_journal_is_dropped(
+    sample_save_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure a commit that never started is not replayed over files changed since."""
+    wm = WorldManager()
+    wm.set_save_directory(sample_save_dir)
+    with monkeypatch.context() as m:
+        _fail_first_staged_rename(m)
+        with pytest.raises(RuntimeError):
+            wm.duplicate_world("world1", "world2")
+
+    metadata = json.loads((sample_save_dir / "enshrouded_user.json").read_text())
+    metadata["worlds"].append(
+        {"id": "world4", "name": "World Four", "createdAt": 0, "lastPlayed": 0}
+    )
+    (sample_save_dir / "enshrouded_user.json").write_text(json.dumps(metadata))
+    WorldManager().set_save_directory(sample_save_dir)
+
+    assert (sample_save_dir / "world2-data").read_text() == "target"
+    metadata = json.loads((sample_save_dir / "enshrouded_user.json").read_text())
+    assert "world4" in {w["id"] for w in metadata["worlds"]}
+    assert not any(sample_save_dir.glob(".wd_journal_*"))
+    assert not any(sample_save_dir.glob(".*.tmp.*"))
+
+
+def test_recovery_keeps_journal_when_tmp_lost(sample_save_dir: Path) -> None:
+    """Ensure a lost temporary file is not taken as renamed unless the target holds its data."""
+    (sample_save_dir / "world2-data").write_text("source")
+    (sample_save_dir / ".world2-index.tmp.abc").write_text("new index")
+    (sample_save_dir / ".wd_journal_123").write_text(
+        json.dumps(
+            [
+                # Renamed before the interruption
+                {
+                    "target": "world2-data",
+                    "tmp": ".world2-data.tmp.gone",
+                    "old": None,
+                    "new": _file_state(sample_save_dir / "world2-data"),
+                },
+                {
+                    "target": "world2-index",
+                    "tmp": ".world2-index.tmp.abc",
+                    "old": _file_state(sample_save_dir / "world2-index"),
+                    "new": _file_state(sample_save_dir / ".world2-index.tmp.abc"),
+                },
+                # Its temporary file was lost before being renamed
+                {
+                    "target": "world2-extra",
+                    "tmp": ".world2-extra.tmp.lost",
+                    "old": None,
+                    "new": [123, 456],
+                },
+                {"target": "world1-data"},
+            ]
+        )
+    )
+
+    WorldManager().set_save_directory(sample_save_dir)
+
+    assert (sample_save_dir / ".wd_journal_123").exists()
+    assert (sample_save_dir / ".world2-index.tmp.abc").exists()
+    assert (sample_save_dir / "world1-data").exists()
+    assert json.loads((sample_save_dir / "world2-index").read_text())["id"] == "world2"
+
+
+def test_save_directory_lock(sample_save_dir: Path) -> None:
+    """Ensure another instance neither recovers nor duplicates while the lock is held."""
+    (sample_save_dir / ".world2-data.tmp.abc").write_text("in flight")
+    wm = WorldManager()
+    wm.set_save_directory(sample_save_dir, recover=False)
+    assert (sample_save_dir / ".world2-data.tmp.abc").exists()
+
+    with wm._lock() as locked:
+        assert locked
+        other = WorldManager()
+        other.set_save_directory(sample_save_dir)
+        assert (sample_save_dir / ".world2-data.tmp.abc").exists()
+        with pytest.raises(RuntimeError):
+            other.duplicate_world("world1", "world2")
+
+    WorldManager().set_save_directory(sample_save_dir)
+    assert not (sample_save_dir / ".world2-data.tmp.abc").exists()
+
+
+def test_index_cache(sample_save_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure unchanged index files are not parsed again and copies are independent."""
+    wm = WorldManager()
+    wm.set_save_directory(sample_save_dir)
+    index_file = sample_save_dir / "world1-index"
+
+    first = wm._read_index_file(index_file)
+    first["latest"] = 99
+
+    def fail_load(*args, **kwargs):
+        raise AssertionError("index file parsed again")
+
+    monkeypatch.setattr(world_duplicator, "_loads_json", fail_load)
+    assert wm._read_index_file(index_file)["latest"] == 1
+
+
+def test_scan_worlds_reuses_unchanged_result(
+    sample_save_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure an unchanged save directory is not re-read, but changes are picked up."""
+    wm = WorldManager()
+    wm.set_save_directory(sample_save_dir)
+    first = wm.scan_worlds()
+
+    def fail_read(*args, **kwargs):
+        raise AssertionError("index file read again")
+
+    with monkeypatch.context() as m:
+        m.setattr(wm, "_read_index_file", fail_read)
+        assert wm.scan_worlds() == first
+
+    (sample_save_dir / "world3-index").write_text(json.dumps({"id": "world3"}))
+    (sample_save_dir / "world3-data").write_text("new")
+    assert "world3" in {world_id for _, world_id in wm.scan_worlds()}
+
+
+def test_scan_worlds_index_removed_during_scan(
+    sample_save_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure an index file deleted after the directory listing is skipped."""
+    wm = WorldManager()
+    wm.set_save_directory(sample_save_dir)
+    wm._scan_fingerprint = None
+
+    original_index_dir = world_duplicator._index_dir
+
+    def index_dir_then_remove(save_dir):
+        result = original_index_dir(save_dir)
+        (sample_save_dir / "world2-index").unlink()
+        return result
+
+    monkeypatch.setattr(world_duplicator, "_index_dir", index_dir_then_remove)
+    assert [world_id for _, world_id in wm.scan_worlds()] == ["world1"]
+
+
+def test_duplicate_world_cancel(sample_save_dir: Path) -> None:
+    """Ensure a cancelled duplication reports progress and leaves the target untouched."""
+    wm = WorldManager()
+    wm.set_save_directory(sample_save_dir)
+    cancel = threading.Event()
+    progress = []
+
+    def on_progress(copied: int, total: int) -> None:
+        progress.append((copied, total))
+        cancel.set()
+
+    result = wm.duplicate_world(
+        "world1", "world2", copy_progress=on_progress, cancel=cancel
+    )
+    assert result is None
+    assert progress
+    assert (sample_save_dir / "world2-data").read_text() == "target"
+    assert not any(sample_save_dir.glob(".*.tmp.*"))
+
+
+def test_duplicate_world_many_files(sample_save_dir: Path) -> None:
+    """Ensure worlds with several files are copied completely."""
+    for i in range(5):
+        (sample_save_dir / f"world1-{i}").write_text(f"chunk {i}")
+    (sample_save_dir / "world1_info-index").write_text("info")
+
+    wm = WorldManager()
+    wm.set_save_directory(sample_save_dir)
+    steps = []
+    written = wm.duplicate_world(
+        "world1", "world2", progress_callback=lambda step, total, msg: steps.append(step)
+    )
+
+    assert written is not None
+    # Every file but the index, which is written separately
+    assert sorted(steps) == list(range(1, 8))
+    for i in range(5):
+        assert (sample_save_dir / f"world2-{i}").read_text() == f"chunk {i}"
+    assert (sample_save_dir / "world2_info-index").read_text() == "info"
+
+
+def test_duplicate_world_failed_copy_stops_others(
+    sample_save_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure one failed copy aborts the copies still running alongside it."""
+    for i in range(3):
+        (sample_save_dir / f"world1-{i}").write_text(f"chunk {i}")
+
+    wm = WorldManager()
+    wm.set_save_directory(sample_save_dir)
+    stopped = []
+
+    def fake_copy(src, dst, progress=None, cancel=None):
+        if src.endswith("world1-0"):
+            raise OSError("disk full")
+        stopped.append(cancel.wait(5))
+
+    monkeypatch.setattr(world_duplicator, "_fast_copy", fake_copy)
+
+    assert wm.duplicate_world("world1", "world2") is None
+    assert stopped and all(stopped)
+    assert (sample_save_dir / "world2-data").read_text() == "target"
+
+
+def test_get_world_metadata(sample_save_dir: Path) -> None:
+    """Ensure metadata lookups by ID return the entry shared with the metadata list."""
+    wm = WorldManager()
+    wm.set_save_directory(sample_save_dir)
+
+    assert wm._get_world_metadata("world1") == ("World One", 0, 0)
+    assert wm._get_world_metadata("missing") == ("", 0, 0)
+
+    wm._meta_by_id["world2"]["name"] = "Renamed"
+    assert next(w for w in wm.metadata["worlds"] if w["id"] == "world2")["name"] == "Renamed"